@@ -0,0 +1,32 @@
+"""Compatibility shim for python2's lack of functools.lru_cache.
+
+On Python 3 this re-exports `functools.lru_cache`; on Python 2 it
+provides a minimal substitute built on `~fs.lrucache.LRUCache`. The
+substitute only supports the decorator-with-arguments form and
+positional, hashable arguments, which is all this package uses.
+"""
+
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+
+    from .lrucache import LRUCache
+
+    def lru_cache(maxsize=128):  # type: ignore
+        def decorator(func):
+            cache = {} if maxsize is None else LRUCache(maxsize)
+
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    result = cache[args] = func(*args)
+                    return result
+
+            wrapper.__wrapped__ = func
+            return wrapper
+
+        return decorator
+
+
+__all__ = ["lru_cache"]
@@ -183,5 +183,15 @@ def write_tar(
             else:
                 tar_info.type = type_map.get(info.type, tarfile.REGTYPE)
                 tar_info.size = info.size
-                with src_fs.openbin(path) as bin_file:
-                    _tar.addfile(tar_info, bin_file)
+                # Get a syspath if possible
+                try:
+                    sys_path = src_fs.getsyspath(path)
+                except NoSysPath:
+                    # Write from the FS layer
+                    with src_fs.openbin(path) as bin_file:
+                        _tar.addfile(tar_info, bin_file)
+                else:
+                    # Write from a file directly, skipping the FS-layer
+                    # open machinery
+                    with open(sys_path, "rb") as bin_file:
+                        _tar.addfile(tar_info, bin_file)
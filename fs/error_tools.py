@@ -3,18 +3,16 @@
 
 from __future__ import print_function, unicode_literals
 
-import sys
 import typing
 
 import errno
 import platform
-from contextlib import contextmanager
 from six import reraise
 
 from . import errors
 
 if typing.TYPE_CHECKING:
-    from typing import Iterator, Optional, Text, Type, Union
+    from typing import Optional, Text, Type, Union
 
     from types import TracebackType
 
@@ -26,47 +24,59 @@ except ImportError:
 
 _WINDOWS_PLATFORM = platform.system() == "Windows"
 
+_BASE_ERRORS = {
+    64: errors.RemoteConnectionError,  # ENONET
+    errno.EACCES: errors.PermissionDenied,
+    errno.ENOENT: errors.ResourceNotFound,
+    errno.EFAULT: errors.ResourceNotFound,
+    errno.ESRCH: errors.ResourceNotFound,
+    errno.ENOTEMPTY: errors.DirectoryNotEmpty,
+    183: errors.DirectoryExists,
+    errno.EISDIR: errors.FileExpected,
+    errno.ENOSPC: errors.InsufficientStorage,
+    errno.EPERM: errors.PermissionDenied,
+    errno.ENETDOWN: errors.RemoteConnectionError,
+    errno.ECONNRESET: errors.RemoteConnectionError,
+    errno.ENAMETOOLONG: errors.PathError,
+    errno.EOPNOTSUPP: errors.Unsupported,
+    errno.ENOSYS: errors.Unsupported,
+}
+
 
 class _ConvertOSErrors(object):
     """Context manager to convert OSErrors in to FS Errors."""
 
-    FILE_ERRORS = {
-        64: errors.RemoteConnectionError,  # ENONET
-        errno.EACCES: errors.PermissionDenied,
-        errno.ENOENT: errors.ResourceNotFound,
-        errno.EFAULT: errors.ResourceNotFound,
-        errno.ESRCH: errors.ResourceNotFound,
-        errno.ENOTEMPTY: errors.DirectoryNotEmpty,
-        errno.EEXIST: errors.FileExists,
-        183: errors.DirectoryExists,
-        # errno.ENOTDIR: errors.DirectoryExpected,
-        errno.ENOTDIR: errors.ResourceNotFound,
-        errno.EISDIR: errors.FileExpected,
-        errno.EINVAL: errors.FileExpected,
-        errno.ENOSPC: errors.InsufficientStorage,
-        errno.EPERM: errors.PermissionDenied,
-        errno.ENETDOWN: errors.RemoteConnectionError,
-        errno.ECONNRESET: errors.RemoteConnectionError,
-        errno.ENAMETOOLONG: errors.PathError,
-        errno.EOPNOTSUPP: errors.Unsupported,
-        errno.ENOSYS: errors.Unsupported,
-    }
-
-    DIR_ERRORS = FILE_ERRORS.copy()
-    DIR_ERRORS[errno.ENOTDIR] = errors.DirectoryExpected
-    DIR_ERRORS[errno.EEXIST] = errors.DirectoryExists
-    DIR_ERRORS[errno.EINVAL] = errors.DirectoryExpected
+    __slots__ = ["_opname", "_path", "_errors_table"]
+
+    FILE_ERRORS = dict(_BASE_ERRORS)
+    FILE_ERRORS.update(
+        {
+            errno.EEXIST: errors.FileExists,
+            # errno.ENOTDIR: errors.DirectoryExpected,
+            errno.ENOTDIR: errors.ResourceNotFound,
+            errno.EINVAL: errors.FileExpected,
+        }
+    )
+
+    DIR_ERRORS = dict(_BASE_ERRORS)
+    DIR_ERRORS.update(
+        {
+            errno.EEXIST: errors.DirectoryExists,
+            errno.ENOTDIR: errors.DirectoryExpected,
+            errno.EINVAL: errors.DirectoryExpected,
+        }
+    )
 
     if _WINDOWS_PLATFORM:  # pragma: no cover
+        FILE_ERRORS[13] = errors.FileExpected
         DIR_ERRORS[13] = errors.DirectoryExpected
         DIR_ERRORS[267] = errors.DirectoryExpected
-        FILE_ERRORS[13] = errors.FileExpected
 
     def __init__(self, opname, path, directory=False):
         # type: (Text, Text, bool) -> None
         self._opname = opname
         self._path = path
-        self._directory = directory
+        self._errors_table = _DIR_ERRORS_TABLE if directory else _FILE_ERRORS_TABLE
 
     def __enter__(self):
         # type: () -> _ConvertOSErrors
@@ -79,23 +89,95 @@ class _ConvertOSErrors(object):
         traceback,  # type: Optional[TracebackType]
     ):
         # type: (...) -> None
-        os_errors = self.DIR_ERRORS if self._directory else self.FILE_ERRORS
-        if exc_type and isinstance(exc_value, EnvironmentError):
+        if exc_type is None:
+            return
+        if isinstance(exc_value, EnvironmentError):
             _errno = exc_value.errno
-            fserror = os_errors.get(_errno, errors.OperationFailed)
-            if _errno == errno.EACCES and sys.platform == "win32":
+            table = self._errors_table
+            if _errno is not None and 0 <= _errno < len(table):
+                fserror = table[_errno] or errors.OperationFailed
+            else:
+                fserror = errors.OperationFailed
+            if _WINDOWS_PLATFORM and _errno == errno.EACCES:
                 if getattr(exc_value, "args", None) == 32:  # pragma: no cover
                     fserror = errors.ResourceLocked
             reraise(fserror, fserror(self._path, exc=exc_value), traceback)
 
 
+def _make_errno_table(os_errors):
+    # type: (...) -> list
+    """Flatten an errno mapping into a direct-index lookup table."""
+    table = [None] * (max(os_errors) + 1)
+    for code, fserror in os_errors.items():
+        table[code] = fserror
+    return table
+
+
+_FILE_ERRORS_TABLE = _make_errno_table(_ConvertOSErrors.FILE_ERRORS)
+_DIR_ERRORS_TABLE = _make_errno_table(_ConvertOSErrors.DIR_ERRORS)
+
+
 # Stops linter complaining about invalid class name
 convert_os_errors = _ConvertOSErrors
 
 
-@contextmanager
-def unwrap_errors(path_replace):
-    # type: (Union[Text, Mapping[Text, Text]]) -> Iterator[None]
+class _UnwrapErrorsPath(object):
+    """Context manager to replace the path in resource errors."""
+
+    __slots__ = ["_path"]
+
+    def __init__(self, path):
+        # type: (Text) -> None
+        self._path = path
+
+    def __enter__(self):
+        # type: () -> _UnwrapErrorsPath
+        return self
+
+    def __exit__(
+        self,
+        exc_type,  # type: Optional[Type[BaseException]]
+        exc_value,  # type: Optional[BaseException]
+        traceback,  # type: Optional[TracebackType]
+    ):
+        # type: (...) -> None
+        if exc_type is None:
+            return
+        if isinstance(exc_value, errors.ResourceError):
+            exc_value.path = self._path
+
+
+class _UnwrapErrorsMapping(object):
+    """Context manager to re-map the paths in resource errors."""
+
+    __slots__ = ["_path_replace"]
+
+    def __init__(self, path_replace):
+        # type: (Mapping[Text, Text]) -> None
+        self._path_replace = path_replace
+
+    def __enter__(self):
+        # type: () -> _UnwrapErrorsMapping
+        return self
+
+    def __exit__(
+        self,
+        exc_type,  # type: Optional[Type[BaseException]]
+        exc_value,  # type: Optional[BaseException]
+        traceback,  # type: Optional[TracebackType]
+    ):
+        # type: (...) -> None
+        if exc_type is None:
+            return
+        if isinstance(exc_value, errors.ResourceError):
+            path_replace = self._path_replace
+            exc_value.path = path_replace.get(exc_value.path, exc_value.path)
+
+
+def unwrap_errors(
+    path_replace,  # type: Union[Text, Mapping[Text, Text]]
+):
+    # type: (...) -> Union[_UnwrapErrorsPath, _UnwrapErrorsMapping]
     """Get a context to map OS errors to their `fs.errors` counterpart.
 
     The context will re-write the paths in resource exceptions to be
@@ -103,15 +185,10 @@ def unwrap_errors(path_replace):
 
     The only parameter may be the path from the parent, if only one path
     is to be unwrapped. Or it may be a dictionary that maps wrapped
-    paths on to unwrapped paths.
+    paths on to unwrapped paths. A plain `dict` is detected without the
+    `Mapping` ABC check, so prefer one over other mapping types.
 
     """
-    try:
-        yield
-    except errors.ResourceError as e:
-        if hasattr(e, "path"):
-            if isinstance(path_replace, Mapping):
-                e.path = path_replace.get(e.path, e.path)
-            else:
-                e.path = path_replace
-        raise
+    if type(path_replace) is dict or isinstance(path_replace, Mapping):
+        return _UnwrapErrorsMapping(path_replace)
+    return _UnwrapErrorsPath(path_replace)
@@ -13,11 +13,14 @@ from __future__ import print_function, unicode_literals
 import typing
 
 import functools
+import string
 import six
 from six import text_type
 
+from ._lrucompat import lru_cache
+
 if typing.TYPE_CHECKING:
-    from typing import Optional, Text
+    from typing import List, Optional, Text
 
 
 __all__ = [
@@ -56,9 +59,64 @@ __all__ = [
 ]
 
 
+_formatter = string.Formatter()
+
+
+@lru_cache(maxsize=512)
+def _compile_template(template):
+    # type: (Text) -> typing.Callable[[_ErrorFields], Text]
+    """Compile a message template into a render callable.
+
+    Templates are usually class constants, so parsing each one once
+    (instead of on every `str.format` call) pays for itself after the
+    first render. The cache is bounded because some callers pass
+    dynamic, pre-formatted messages.
+
+    """
+    parts = list(_formatter.parse(template))
+
+    def render(fields):
+        # type: (_ErrorFields) -> Text
+        result = []  # type: List[Text]
+        append = result.append
+        for literal, field, spec, conversion in parts:
+            if literal:
+                append(literal)
+            if field is not None:
+                value = fields[field]
+                if conversion:
+                    value = _formatter.convert_field(value, conversion)
+                append(format(value, spec or ""))
+        return "".join(result)
+
+    return render
+
+
+class _ErrorFields(object):
+    """Adapter exposing an error's attributes to `str.format_map`.
+
+    Looking fields up through `getattr` (rather than unpacking
+    ``__dict__``) lets message templates reference lazy properties
+    such as `OperationFailed.details`.
+
+    """
+
+    __slots__ = ["_error"]
+
+    def __init__(self, error):
+        # type: (Exception) -> None
+        self._error = error
+
+    def __getitem__(self, key):
+        # type: (Text) -> object
+        return getattr(self._error, key)
+
+
 class MissingInfoNamespace(AttributeError):
     """An expected namespace is missing."""
 
+    __slots__ = ["namespace"]
+
     def __init__(self, namespace):  # noqa: D107
         # type: (Text) -> None
         self.namespace = namespace
@@ -75,21 +133,35 @@ class FSError(Exception):
 
     default_message = "Unspecified error"
 
+    __slots__ = ["_msg", "_formatted"]
+
     def __init__(self, msg=None):  # noqa: D107
         # type: (Optional[Text]) -> None
+        # Exception.__init__ is deliberately not called: it only sets
+        # `args`, which this hierarchy never uses (`__str__` renders
+        # from `_msg` and pickling goes through `__reduce__`).
         self._msg = msg or self.default_message
-        super(FSError, self).__init__()
+        self._formatted = None  # type: Optional[Text]
+
+    def __setattr__(self, name, value):
+        # type: (Text, object) -> None
+        # Changing any attribute may affect the rendered message (e.g.
+        # `unwrap_errors` rewrites `path`), so drop the cached copy.
+        object.__setattr__(self, name, value)
+        if name != "_formatted":
+            object.__setattr__(self, "_formatted", None)
 
     def __str__(self):
         # type: () -> Text
         """Return the error message."""
-        msg = self._msg.format(**self.__dict__)
+        msg = self._formatted
+        if msg is None:
+            msg = self._formatted = _compile_template(self._msg)(_ErrorFields(self))
         return msg
 
     def __repr__(self):
         # type: () -> Text
-        msg = self._msg.format(**self.__dict__)
-        return "{}({!r})".format(self.__class__.__name__, msg)
+        return "{}({!r})".format(self.__class__.__name__, self.__str__())
 
 
 class FilesystemClosed(FSError):
@@ -103,6 +175,8 @@ class BulkCopyFailed(FSError):
 
     default_message = "One or more copy operations failed (see errors attribute)"
 
+    __slots__ = ["errors"]
+
     def __init__(self, errors):  # noqa: D107
         self.errors = errors
         super(BulkCopyFailed, self).__init__()
@@ -113,12 +187,23 @@ class CreateFailed(FSError):
 
     default_message = "unable to create filesystem, {details}"
 
+    __slots__ = ["_details", "exc"]
+
     def __init__(self, msg=None, exc=None):  # noqa: D107
         # type: (Optional[Text], Optional[Exception]) -> None
         self._msg = msg or self.default_message
-        self.details = "" if exc is None else text_type(exc)
+        self._details = None  # type: Optional[Text]
         self.exc = exc
 
+    @property
+    def details(self):
+        # type: () -> Text
+        """`str`: the text of the wrapped exception, if any."""
+        details = self._details
+        if details is None:
+            details = self._details = "" if self.exc is None else text_type(self.exc)
+        return details
+
     @classmethod
     def catch_all(cls, func):
         @functools.wraps(func)
@@ -141,6 +226,8 @@ class PathError(FSError):
 
     default_message = "path '{path}' is invalid"
 
+    __slots__ = ["path", "exc"]
+
     def __init__(self, path, msg=None, exc=None):  # noqa: D107
         # type: (Text, Optional[Text], Optional[Exception]) -> None
         self.path = path
@@ -162,6 +249,8 @@ class NoURL(PathError):
 
     default_message = "path '{path}' has no '{purpose}' URL"
 
+    __slots__ = ["purpose"]
+
     def __init__(self, path, purpose, msg=None):  # noqa: D107
         # type: (Text, Text, Optional[Text]) -> None
         self.purpose = purpose
@@ -188,6 +277,8 @@ class OperationFailed(FSError):
 
     default_message = "operation failed, {details}"
 
+    __slots__ = ["path", "exc", "_details", "errno"]
+
     def __init__(
         self,
         path=None,  # type: Optional[Text]
@@ -197,10 +288,19 @@ class OperationFailed(FSError):
         # type: (...) -> None
         self.path = path
         self.exc = exc
-        self.details = "" if exc is None else text_type(exc)
+        self._details = None  # type: Optional[Text]
         self.errno = getattr(exc, "errno", None)
         super(OperationFailed, self).__init__(msg=msg)
 
+    @property
+    def details(self):
+        # type: () -> Text
+        """`str`: the text of the wrapped exception, if any."""
+        details = self._details
+        if details is None:
+            details = self._details = "" if self.exc is None else text_type(self.exc)
+        return details
+
     def __reduce__(self):
         return type(self), (self.path, self.exc, self._msg)
 
@@ -256,6 +356,8 @@ class ResourceError(FSError):
 
     default_message = "failed on path {path}"
 
+    __slots__ = ["path", "exc"]
+
     def __init__(self, path, exc=None, msg=None):  # noqa: D107
         # type: (Text, Optional[Exception], Optional[Text]) -> None
         self.path = path
@@ -339,6 +441,8 @@ class IllegalBackReference(ValueError):
 
     """
 
+    __slots__ = ["path"]
+
     def __init__(self, path):  # noqa: D107
         # type: (Text) -> None
         self.path = path
@@ -365,11 +469,15 @@ class PatternError(ValueError):
 
     default_message = "pattern '{pattern}' is invalid at position {position}"
 
+    __slots__ = ["pattern", "position", "exc"]
+
     def __init__(self, pattern, position, exc=None, msg=None):  # noqa: D107
         # type: (Text, int, Optional[Exception], Optional[Text]) -> None
         self.pattern = pattern
         self.position = position
         self.exc = exc
+        # Unlike FSError, this is a plain ValueError with the default
+        # __str__, so `args` must be reset here.
         super(ValueError, self).__init__()
 
     def __reduce__(self):
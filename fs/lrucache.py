@@ -5,13 +5,15 @@ from __future__ import absolute_import, unicode_literals
 
 import typing
 
-from collections import OrderedDict
-
 _K = typing.TypeVar("_K")
 _V = typing.TypeVar("_V")
 
+# Node layout for the circular doubly-linked list of cache entries
+# (the same scheme used by functools.lru_cache).
+_PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
 
-class LRUCache(OrderedDict, typing.Generic[_K, _V]):
+class LRUCache(typing.Generic[_K, _V]):
     """A dictionary-like container that stores a given maximum items.
 
     If an additional item is added when the LRUCache is full, the least
@@ -23,21 +25,91 @@ class LRUCache(OrderedDict, typing.Generic[_K, _V]):
         # type: (int) -> None
         """Create a new LRUCache with the given size."""
         self.cache_size = cache_size
-        super(LRUCache, self).__init__()
+        self._map = {}  # type: dict
+        # Sentinel node; oldest entry is at root[_NEXT], newest at
+        # root[_PREV].
+        self._root = root = []  # type: list
+        root[:] = [root, root, None, None]
 
-    def __setitem__(self, key, value):
-        # type: (_K, _V) -> None
-        """Store a new views, potentially discarding an old value."""
-        if key not in self:
-            if len(self) >= self.cache_size:
-                self.popitem(last=False)
-        OrderedDict.__setitem__(self, key, value)
+    def __repr__(self):
+        # type: () -> str
+        return "LRUCache({!r})".format(self.cache_size)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._map)
+
+    def __contains__(self, key):
+        # type: (object) -> bool
+        return key in self._map
+
+    def __iter__(self):
+        # type: () -> typing.Iterator[_K]
+        """Iterate over the keys, least recently used first."""
+        root = self._root
+        node = root[_NEXT]
+        while node is not root:
+            yield node[_KEY]
+            node = node[_NEXT]
+
+    def _bump(self, node):
+        # type: (list) -> None
+        """Move a node to the most recently used position."""
+        prev, _next = node[_PREV], node[_NEXT]
+        prev[_NEXT] = _next
+        _next[_PREV] = prev
+        root = self._root
+        last = root[_PREV]
+        node[_PREV] = last
+        node[_NEXT] = root
+        last[_NEXT] = root[_PREV] = node
 
     def __getitem__(self, key):
         # type: (_K) -> _V
         """Get the item, but also makes it most recent."""
-        _super = typing.cast(OrderedDict, super(LRUCache, self))
-        value = _super.__getitem__(key)
-        _super.__delitem__(key)
-        _super.__setitem__(key, value)
-        return value
+        node = self._map[key]
+        self._bump(node)
+        return node[_VALUE]
+
+    def __setitem__(self, key, value):
+        # type: (_K, _V) -> None
+        """Store a new views, potentially discarding an old value."""
+        node = self._map.get(key)
+        if node is not None:
+            node[_VALUE] = value
+            self._bump(node)
+            return
+        if len(self._map) >= self.cache_size:
+            # Evict the least recently used entry.
+            oldest = self._root[_NEXT]
+            oldest_next = oldest[_NEXT]
+            self._root[_NEXT] = oldest_next
+            oldest_next[_PREV] = self._root
+            del self._map[oldest[_KEY]]
+        root = self._root
+        last = root[_PREV]
+        node = [last, root, key, value]
+        last[_NEXT] = root[_PREV] = node
+        self._map[key] = node
+
+    def __delitem__(self, key):
+        # type: (_K) -> None
+        node = self._map.pop(key)
+        prev, _next = node[_PREV], node[_NEXT]
+        prev[_NEXT] = _next
+        _next[_PREV] = prev
+
+    def get(self, key, default=None):
+        # type: (_K, typing.Optional[_V]) -> typing.Optional[_V]
+        """Get the item with the given key, or a default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        # type: () -> None
+        """Discard all cached items."""
+        self._map.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
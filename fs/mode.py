@@ -11,6 +11,7 @@ import typing
 
 import six
 
+from ._lrucompat import lru_cache
 from ._typing import Text
 
 if typing.TYPE_CHECKING:
@@ -20,6 +21,38 @@ if typing.TYPE_CHECKING:
 __all__ = ["Mode", "check_readable", "check_writable", "validate_openbin_mode"]
 
 
+_R = 1
+_W = 2
+_X = 4
+_A = 8
+_T = 16
+_B = 32
+_PLUS = 64
+
+_CHAR_TO_FLAG = {
+    "r": _R,
+    "w": _W,
+    "x": _X,
+    "a": _A,
+    "t": _T,
+    "b": _B,
+    "+": _PLUS,
+}
+
+_CREATE = _W | _X | _A
+_READING = _R | _PLUS
+_WRITING = _W | _X | _A | _PLUS
+_TRUNCATE = _W | _X
+
+_MODE_CHARS = frozenset("rwxtab+")
+
+# Mode strings seen to pass validation against the default charset;
+# validation is pure, so a prior success means the string can be
+# accepted without re-checking. Custom charsets bypass the cache.
+_VALIDATED_MODES = set()  # type: Set[Text]
+_VALIDATED_MODES_CAP = 256
+
+
 # https://docs.python.org/3/library/functions.html#open
 @six.python_2_unicode_compatible
 class Mode(typing.Container[Text]):
@@ -55,6 +88,10 @@ class Mode(typing.Container[Text]):
         """
         self._mode = mode
         self.validate()
+        _flags = 0
+        for char in mode:
+            _flags |= _CHAR_TO_FLAG[char]
+        self._flags = _flags
 
     def __repr__(self):
         # type: () -> Text
@@ -68,7 +105,7 @@ class Mode(typing.Container[Text]):
         # type: (object) -> bool
         """Check if a mode contains a given character."""
         assert isinstance(character, Text)
-        return character in self._mode
+        return bool(self._flags & _CHAR_TO_FLAG.get(character, 0))
 
     def to_platform(self):
         # type: () -> Text
@@ -90,7 +127,7 @@ class Mode(typing.Container[Text]):
         _mode = self.to_platform().replace("t", "")
         return _mode if "b" in _mode else _mode + "b"
 
-    def validate(self, _valid_chars=frozenset("rwxtab+")):
+    def validate(self, _valid_chars=_MODE_CHARS):
         # type: (Union[Set[Text], FrozenSet[Text]]) -> None
         """Validate the mode string.
 
@@ -99,14 +136,20 @@ class Mode(typing.Container[Text]):
 
         """
         mode = self._mode
+        is_default_chars = _valid_chars is _MODE_CHARS
+        if is_default_chars and mode in _VALIDATED_MODES:
+            return
         if not mode:
             raise ValueError("mode must not be empty")
-        if not _valid_chars.issuperset(mode):
-            raise ValueError("mode '{}' contains invalid characters".format(mode))
+        for char in mode:
+            if char not in _valid_chars:
+                raise ValueError("mode '{}' contains invalid characters".format(mode))
         if mode[0] not in "rwxa":
             raise ValueError("mode must start with 'r', 'w', 'x', or 'a'")
         if "t" in mode and "b" in mode:
             raise ValueError("mode can't be binary ('b') and text ('t')")
+        if is_default_chars and len(_VALIDATED_MODES) < _VALIDATED_MODES_CAP:
+            _VALIDATED_MODES.add(mode)
 
     def validate_bin(self):
         # type: () -> None
@@ -124,57 +167,58 @@ class Mode(typing.Container[Text]):
     def create(self):
         # type: () -> bool
         """`bool`: `True` if the mode would create a file."""
-        return "a" in self or "w" in self or "x" in self
+        return bool(self._flags & _CREATE)
 
     @property
     def reading(self):
         # type: () -> bool
         """`bool`: `True` if the mode permits reading."""
-        return "r" in self or "+" in self
+        return bool(self._flags & _READING)
 
     @property
     def writing(self):
         # type: () -> bool
         """`bool`: `True` if the mode permits writing."""
-        return "w" in self or "a" in self or "+" in self or "x" in self
+        return bool(self._flags & _WRITING)
 
     @property
     def appending(self):
         # type: () -> bool
         """`bool`: `True` if the mode permits appending."""
-        return "a" in self
+        return bool(self._flags & _A)
 
     @property
     def updating(self):
         # type: () -> bool
         """`bool`: `True` if the mode permits both reading and writing."""
-        return "+" in self
+        return bool(self._flags & _PLUS)
 
     @property
     def truncate(self):
         # type: () -> bool
         """`bool`: `True` if the mode would truncate an existing file."""
-        return "w" in self or "x" in self
+        return bool(self._flags & _TRUNCATE)
 
     @property
     def exclusive(self):
         # type: () -> bool
         """`bool`: `True` if the mode require exclusive creation."""
-        return "x" in self
+        return bool(self._flags & _X)
 
     @property
     def binary(self):
         # type: () -> bool
         """`bool`: `True` if a mode specifies binary."""
-        return "b" in self
+        return bool(self._flags & _B)
 
     @property
     def text(self):
         # type: () -> bool
         """`bool`: `True` if a mode specifies text."""
-        return "t" in self or "b" not in self
+        return not self._flags & _B or bool(self._flags & _T)
 
 
+@lru_cache(maxsize=64)
 def check_readable(mode):
     # type: (Text) -> bool
     """Check a mode string allows reading.
@@ -189,6 +233,7 @@ def check_readable(mode):
     return Mode(mode).reading
 
 
+@lru_cache(maxsize=64)
 def check_writable(mode):
     # type: (Text) -> bool
     """Check a mode string allows writing.
@@ -203,6 +248,7 @@ def check_writable(mode):
     return Mode(mode).writing
 
 
+@lru_cache(maxsize=64)
 def validate_open_mode(mode):
     # type: (Text) -> None
     """Check ``mode`` parameter of `~fs.base.FS.open` is valid.
@@ -217,7 +263,29 @@ def validate_open_mode(mode):
     Mode(mode)
 
 
-def validate_openbin_mode(mode, _valid_chars=frozenset("rwxab+")):
+_OPENBIN_CHARS = frozenset("rwxab+")
+
+
+def _validate_openbin_mode(mode, _valid_chars):
+    # type: (Text, Union[Set[Text], FrozenSet[Text]]) -> None
+    if "t" in mode:
+        raise ValueError("text mode not valid in openbin")
+    if not mode:
+        raise ValueError("mode must not be empty")
+    if mode[0] not in "rwxa":
+        raise ValueError("mode must start with 'r', 'w', 'a' or 'x'")
+    for char in mode:
+        if char not in _valid_chars:
+            raise ValueError("mode '{}' contains invalid characters".format(mode))
+
+
+@lru_cache(maxsize=64)
+def _validate_openbin_mode_default(mode):
+    # type: (Text) -> None
+    _validate_openbin_mode(mode, _OPENBIN_CHARS)
+
+
+def validate_openbin_mode(mode, _valid_chars=_OPENBIN_CHARS):
     # type: (Text, Union[Set[Text], FrozenSet[Text]]) -> None
     """Check ``mode`` parameter of `~fs.base.FS.openbin` is valid.
 
@@ -228,11 +296,9 @@ def validate_openbin_mode(mode, _valid_chars=frozenset("rwxab+")):
         `ValueError` if mode is not valid.
 
     """
-    if "t" in mode:
-        raise ValueError("text mode not valid in openbin")
-    if not mode:
-        raise ValueError("mode must not be empty")
-    if mode[0] not in "rwxa":
-        raise ValueError("mode must start with 'r', 'w', 'a' or 'x'")
-    if not _valid_chars.issuperset(mode):
-        raise ValueError("mode '{}' contains invalid characters".format(mode))
+    if _valid_chars is _OPENBIN_CHARS:
+        # Only the default charset goes through the cache: a custom
+        # charset may be unhashable and must not share cache entries.
+        _validate_openbin_mode_default(mode)
+    else:
+        _validate_openbin_mode(mode, _valid_chars)
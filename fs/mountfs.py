@@ -8,9 +8,11 @@ import typing
 from six import text_type
 
 from . import errors
+from ._lrucompat import lru_cache
 from .base import FS
 from .memoryfs import MemoryFS
 from .mode import validate_open_mode, validate_openbin_mode
+from .opener import open_fs
 from .path import abspath, forcedir, normpath
 
 if typing.TYPE_CHECKING:
@@ -18,9 +20,6 @@ if typing.TYPE_CHECKING:
         IO,
         Any,
         BinaryIO,
-        Collection,
-        Iterator,
-        List,
         MutableSequence,
         Optional,
         Text,
@@ -28,11 +27,6 @@ if typing.TYPE_CHECKING:
         Union,
     )
 
-    from .enums import ResourceType
-    from .info import Info, RawInfo
-    from .permissions import Permissions
-    from .subfs import SubFS
-
     M = typing.TypeVar("M", bound="MountFS")
 
 
@@ -40,6 +34,32 @@ class MountError(Exception):
     """Thrown when mounts conflict."""
 
 
+# Key under which a trie node stores its mounted filesystem. An object
+# sentinel can never collide with a path segment.
+_MOUNT_KEY = object()
+
+
+def _delegate_to_mount(method_name):
+    # type: (Text) -> Any
+    """Make a method that forwards a path operation to its mount.
+
+    The generated method inlines the closed check and delegation, so a
+    dispatched call is a single attribute test plus the trie walk
+    before the real work starts.
+
+    """
+
+    def delegated(self, path, *args, **kwargs):
+        # type: (MountFS, Text, *Any, **Any) -> Any
+        if self._closed:
+            raise errors.FilesystemClosed()
+        fs, _path = self._delegate(path)
+        return getattr(fs, method_name)(_path, *args, **kwargs)
+
+    delegated.__name__ = str(method_name)
+    return delegated
+
+
 class MountFS(FS):
     """A virtual filesystem that maps directories on to other file-systems."""
 
@@ -64,6 +84,13 @@ class MountFS(FS):
         self.auto_close = auto_close
         self.default_fs = MemoryFS()  # type: FS
         self.mounts = []  # type: MutableSequence[Tuple[Text, FS]]
+        # Trie of path segments, so delegation cost depends on path
+        # depth rather than the number of mounts.
+        self._mount_trie = {}  # type: dict
+        # The most recently matched (prefix, fs) pair; successive
+        # operations tend to hit the same mount, so checking it first
+        # skips the trie walk.
+        self._last_mount = None  # type: Optional[Tuple[Text, FS]]
 
     def __repr__(self):
         # type: () -> str
@@ -73,6 +100,19 @@ class MountFS(FS):
         # type: () -> str
         return "<mountfs>"
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize(path):
+        # type: (Text) -> Tuple[Text, Text]
+        """Get the ``forcedir`` and plain normalized forms of a path.
+
+        Delegated operations frequently repeat paths (walks, scandir
+        loops), so the string transforms are memoized.
+
+        """
+        _path = abspath(normpath(path))
+        return forcedir(_path), _path
+
     def _delegate(self, path):
         # type: (Text) -> Tuple[FS, Text]
         """Get the delegate FS for a given path.
@@ -86,12 +126,37 @@ class MountFS(FS):
             given ``path``.
 
         """
-        _path = forcedir(abspath(normpath(path)))
-        is_mounted = _path.startswith
-
-        for mount_path, fs in self.mounts:
-            if is_mounted(mount_path):
-                return fs, _path[len(mount_path) :].rstrip("/")
+        _path, _plain = self._normalize(path)
+        # Prefixes are matched against the ``forcedir`` form, but the
+        # remainder is sliced from the plain form, which has no trailing
+        # slash to strip.
+        last = self._last_mount
+        if last is not None:
+            prefix, fs = last
+            if _path.startswith(prefix):
+                return fs, _plain[len(prefix) :]
+
+        node = self._mount_trie
+        mounted = node.get(_MOUNT_KEY)
+        if mounted is not None:
+            # Mounted on root; everything delegates to it.
+            self._last_mount = ("/", mounted)
+            return mounted, _plain[1:]
+
+        segments = _path.strip("/").split("/") if _path != "/" else []
+        for index, segment in enumerate(segments):
+            child = node.get(segment)
+            if child is None:
+                break
+            node = child
+            mounted = node.get(_MOUNT_KEY)
+            if mounted is not None:
+                # Mounts can't overlap, so this is the only match.
+                self._last_mount = (
+                    "/" + "/".join(segments[: index + 1]) + "/",
+                    mounted,
+                )
+                return mounted, "/".join(segments[index + 1 :])
 
         return self.default_fs, path
 
@@ -105,8 +170,6 @@ class MountFS(FS):
 
         """
         if isinstance(fs, text_type):
-            from .opener import open_fs
-
             fs = open_fs(fs)
 
         if not isinstance(fs, FS):
@@ -116,11 +179,28 @@ class MountFS(FS):
             raise ValueError("Unable to mount self")
         _path = forcedir(abspath(normpath(path)))
 
-        for mount_path, _ in self.mounts:
-            if _path.startswith(mount_path):
+        segments = _path.strip("/").split("/") if _path != "/" else []
+        node = self._mount_trie
+        for index, segment in enumerate(segments):
+            if _MOUNT_KEY in node:
+                # The new mount point is under an existing mount.
+                raise MountError("mount point overlaps existing mount")
+            child = node.get(segment)
+            if child is None:
+                # The remaining segments are new, so no existing mount
+                # can conflict; create the branch and stop checking.
+                for segment in segments[index:]:
+                    node = node.setdefault(segment, {})
+                break
+            node = child
+        else:
+            if node:
+                # An existing mount is at or under the new mount point.
                 raise MountError("mount point overlaps existing mount")
+        node[_MOUNT_KEY] = fs
 
         self.mounts.append((_path, fs))
+        self._last_mount = None
         self.default_fs.makedirs(_path, recreate=True)
 
     def close(self):
@@ -130,6 +210,8 @@ class MountFS(FS):
             for _path, fs in self.mounts:
                 fs.close()
             del self.mounts[:]
+            self._mount_trie.clear()
+            self._last_mount = None
         self.default_fs.close()
         super(MountFS, self).close()
 
@@ -142,135 +224,56 @@ class MountFS(FS):
             fs = self
         return "{path} on {fs}".format(fs=fs, path=delegate_path)
 
-    def getinfo(self, path, namespaces=None):
-        # type: (Text, Optional[Collection[Text]]) -> Info
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.getinfo(_path, namespaces=namespaces)
-
-    def listdir(self, path):
-        # type: (Text) -> List[Text]
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.listdir(_path)
-
-    def makedir(self, path, permissions=None, recreate=False):
-        # type: (Text, Optional[Permissions], bool) -> SubFS[FS]
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.makedir(_path, permissions=permissions, recreate=recreate)
+    getinfo = _delegate_to_mount("getinfo")
+    listdir = _delegate_to_mount("listdir")
+    makedir = _delegate_to_mount("makedir")
+    remove = _delegate_to_mount("remove")
+    readbytes = _delegate_to_mount("readbytes")
+    readtext = _delegate_to_mount("readtext")
+    getsize = _delegate_to_mount("getsize")
+    getsyspath = _delegate_to_mount("getsyspath")
+    gettype = _delegate_to_mount("gettype")
+    geturl = _delegate_to_mount("geturl")
+    hasurl = _delegate_to_mount("hasurl")
+    isdir = _delegate_to_mount("isdir")
+    isfile = _delegate_to_mount("isfile")
+    scandir = _delegate_to_mount("scandir")
+    setinfo = _delegate_to_mount("setinfo")
+    upload = _delegate_to_mount("upload")
+    writebytes = _delegate_to_mount("writebytes")
 
     def openbin(self, path, mode="r", buffering=-1, **kwargs):
         # type: (Text, Text, int, **Any) -> BinaryIO
         validate_openbin_mode(mode)
-        self.check()
+        if self._closed:
+            raise errors.FilesystemClosed()
         fs, _path = self._delegate(path)
         return fs.openbin(_path, mode=mode, buffering=-1, **kwargs)
 
-    def remove(self, path):
-        # type: (Text) -> None
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.remove(_path)
-
     def removedir(self, path):
         # type: (Text) -> None
-        self.check()
-        path = normpath(path)
-        if path in ("", "/"):
-            raise errors.RemoveRootError(path)
-        fs, _path = self._delegate(path)
-        return fs.removedir(_path)
-
-    def readbytes(self, path):
-        # type: (Text) -> bytes
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.readbytes(_path)
+        if self._closed:
+            raise errors.FilesystemClosed()
+        _path = self._normalize(path)[1]
+        if _path == "/":
+            raise errors.RemoveRootError(_path)
+        fs, _sub_path = self._delegate(_path)
+        return fs.removedir(_sub_path)
 
     def download(self, path, file, chunk_size=None, **options):
         # type: (Text, BinaryIO, Optional[int], **Any) -> None
         fs, _path = self._delegate(path)
         return fs.download(_path, file, chunk_size=chunk_size, **options)
 
-    def readtext(
-        self,
-        path,  # type: Text
-        encoding=None,  # type: Optional[Text]
-        errors=None,  # type: Optional[Text]
-        newline="",  # type: Text
-    ):
-        # type: (...) -> Text
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.readtext(_path, encoding=encoding, errors=errors, newline=newline)
-
-    def getsize(self, path):
-        # type: (Text) -> int
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.getsize(_path)
-
-    def getsyspath(self, path):
-        # type: (Text) -> Text
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.getsyspath(_path)
-
-    def gettype(self, path):
-        # type: (Text) -> ResourceType
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.gettype(_path)
-
-    def geturl(self, path, purpose="download"):
-        # type: (Text, Text) -> Text
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.geturl(_path, purpose=purpose)
-
-    def hasurl(self, path, purpose="download"):
-        # type: (Text, Text) -> bool
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.hasurl(_path, purpose=purpose)
-
-    def isdir(self, path):
-        # type: (Text) -> bool
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.isdir(_path)
-
-    def isfile(self, path):
-        # type: (Text) -> bool
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.isfile(_path)
-
-    def scandir(
-        self,
-        path,  # type: Text
-        namespaces=None,  # type: Optional[Collection[Text]]
-        page=None,  # type: Optional[Tuple[int, int]]
-    ):
-        # type: (...) -> Iterator[Info]
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.scandir(_path, namespaces=namespaces, page=page)
-
-    def setinfo(self, path, info):
-        # type: (Text, RawInfo) -> None
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.setinfo(_path, info)
-
     def validatepath(self, path):
         # type: (Text) -> Text
-        self.check()
+        if self._closed:
+            raise errors.FilesystemClosed()
         fs, _path = self._delegate(path)
         fs.validatepath(_path)
-        path = abspath(normpath(path))
-        return path
+        # The second element of _normalize is abspath(normpath(path)),
+        # already computed (and cached) by _delegate.
+        return self._normalize(path)[1]
 
     def open(
         self,
@@ -284,6 +287,8 @@ class MountFS(FS):
     ):
         # type: (...) -> IO
         validate_open_mode(mode)
+        # `errors` here is the encoding error handler parameter, which
+        # shadows the `fs.errors` module; `check` raises on our behalf.
         self.check()
         fs, _path = self._delegate(path)
         return fs.open(
@@ -296,18 +301,6 @@ class MountFS(FS):
             **options
         )
 
-    def upload(self, path, file, chunk_size=None, **options):
-        # type: (Text, BinaryIO, Optional[int], **Any) -> None
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.upload(_path, file, chunk_size=chunk_size, **options)
-
-    def writebytes(self, path, contents):
-        # type: (Text, bytes) -> None
-        self.check()
-        fs, _path = self._delegate(path)
-        return fs.writebytes(_path, contents)
-
     def writetext(
         self,
         path,  # type: Text
@@ -7,7 +7,9 @@ import typing
 
 import collections
 import re
+
 import six
+from six.moves import intern
 from six.moves.urllib.parse import parse_qs, unquote
 
 from .errors import ParseError
@@ -37,7 +39,12 @@ class ParseResult(
 
     """
 
+    __slots__ = ()
+
 
+# The FS URL grammar, kept for reference (and for any external code
+# importing it). `parse_fs_url` implements the same syntax with plain
+# string scans, which avoids the regex engine's backtracking.
 _RE_FS_URL = re.compile(
     r"""
 ^
@@ -71,25 +78,41 @@ def parse_fs_url(fs_url):
         ~fs.errors.ParseError: if the FS URL is not valid.
 
     """
-    match = _RE_FS_URL.match(fs_url)
-    if match is None:
+    scheme_end = fs_url.find("://")
+    if scheme_end == -1:
         raise ParseError("{!r} is not a fs2 url".format(fs_url))
-
-    fs_name, credentials, url1, url2, path = match.groups()
-    if not credentials:
-        username = None  # type: Optional[Text]
-        password = None  # type: Optional[Text]
-        url = url2
-    else:
+    # Protocols come from a small closed set ("osfs", "mem", ...);
+    # interning makes the registry's dict lookups pointer comparisons.
+    fs_name = intern(fs_url[:scheme_end])
+    url = fs_url[scheme_end + 3 :]
+
+    username = None  # type: Optional[Text]
+    password = None  # type: Optional[Text]
+    credentials_end = url.find("@")
+    if credentials_end != -1:
+        credentials = url[:credentials_end]
+        url = url[credentials_end + 1 :]
         username, _, password = credentials.partition(":")
-        username = unquote(username)
-        password = unquote(password)
-        url = url1
+        if "%" in username:
+            username = unquote(username)
+        if "%" in password:
+            password = unquote(password)
+
+    path_start = url.find("!")
+    if path_start == -1:
+        path = None  # type: Optional[Text]
+    else:
+        path = url[path_start + 1 :]
+        url = url[:path_start]
     url, has_qs, qs = url.partition("?")
-    resource = unquote(url)
+    resource = unquote(url) if "%" in url else url
     if has_qs:
         _params = parse_qs(qs, keep_blank_values=True)
         params = {k: unquote(v[0]) for k, v in six.iteritems(_params)}
     else:
+        # A fresh dict per parse: `params` is public and mutable, so
+        # results must not share state.
         params = {}
-    return ParseResult(fs_name, username, password, resource, params, path)
+    return tuple.__new__(
+        ParseResult, (fs_name, username, password, resource, params, path)
+    )
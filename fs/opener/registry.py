@@ -39,6 +39,9 @@ class Registry(object):
         self.default_opener = default_opener
         self.load_extern = load_extern
         self._protocols = {}  # type: Dict[Text, Opener]
+        # Resolved protocol -> opener instances, so repeated opens skip
+        # entry-point scanning and dispatch.
+        self._opener_cache = {}  # type: Dict[Text, Opener]
 
     def __repr__(self):
         # type: () -> Text
@@ -66,6 +69,7 @@ class Registry(object):
         assert _opener.protocols, "must list one or more protocols"
         for protocol in _opener.protocols:
             self._protocols[protocol] = _opener
+            self._opener_cache.pop(protocol, None)
         return _opener
 
     @property
@@ -101,6 +105,11 @@ class Registry(object):
         """
         protocol = protocol or self.default_opener
 
+        try:
+            return self._opener_cache[protocol]
+        except KeyError:
+            pass
+
         if self.load_extern:
             entry_point = next(
                 pkg_resources.iter_entry_points("fs.opener", protocol), None
@@ -136,6 +145,7 @@ class Registry(object):
                     "could not instantiate opener; {}".format(exception)
                 )
 
+        self._opener_cache[protocol] = opener_instance
         return opener_instance
 
     def open(
@@ -7,7 +7,7 @@ import typing
 
 import six
 
-from .path import abspath, join, normpath, relpath
+from .path import _requires_normalization, abspath, join, normpath, relpath
 from .wrapfs import WrapFS
 
 if typing.TYPE_CHECKING:
@@ -33,6 +33,9 @@ class SubFS(WrapFS[_F], typing.Generic[_F]):
         # type: (_F, Text) -> None
         super(SubFS, self).__init__(parent_fs)
         self._sub_dir = abspath(normpath(path))
+        # Prefix for delegate_path's fast path; empty when the sub
+        # directory is the root so concatenation never doubles "/".
+        self._sub_dir_prefix = "" if self._sub_dir == "/" else self._sub_dir
 
     def __repr__(self):
         # type: () -> Text
@@ -50,7 +53,16 @@ class SubFS(WrapFS[_F], typing.Generic[_F]):
 
     def delegate_path(self, path):
         # type: (Text) -> Tuple[_F, Text]
-        _path = join(self._sub_dir, relpath(normpath(path)))
+        if (
+            path.startswith("/")
+            and not path.endswith("/")
+            and not _requires_normalization(path)
+        ):
+            # Already in canonical form; graft it straight on to the
+            # sub directory and skip the normalize/join machinery.
+            _path = self._sub_dir_prefix + path
+        else:
+            _path = join(self._sub_dir, relpath(normpath(path)))
         return self._wrap_fs, _path
 
 
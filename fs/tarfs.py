@@ -6,12 +6,13 @@ from __future__ import print_function, unicode_literals
 import typing
 from typing import IO, cast
 
+import io
 import os
 import six
 import tarfile
-from collections import OrderedDict
 
 from . import errors
+from ._lrucompat import lru_cache
 from ._url_tools import url_quote
 from .base import FS
 from .compress import write_tar
@@ -20,7 +21,7 @@ from .errors import IllegalBackReference, NoURL
 from .info import Info
 from .iotools import RawWrapper
 from .opener import open_fs
-from .path import basename, frombase, isbase, normpath, parts, relpath
+from .path import basename, relpath
 from .permissions import Permissions
 from .wrapfs import WrapFS
 
@@ -48,6 +49,53 @@ if typing.TYPE_CHECKING:
 __all__ = ["TarFS", "WriteTarFS", "ReadTarFS"]
 
 
+# Buffer size for reading archives opened by filename. Decompressors
+# issue many small reads; a large buffer keeps them off the disk.
+_READ_BUFFER_SIZE = 256 * 1024
+
+
+# The ``is*`` predicate methods of TarInfo, paired with the key they
+# are reported under in the "tar" info namespace. Computed once so
+# `getinfo` doesn't reflect over the class per call.
+_TAR_IS_METHODS = tuple(
+    (name.replace("is", "is_"), name)
+    for name in dir(tarfile.TarInfo)
+    if name.startswith("is")
+)
+
+
+def _build_type_array(type_map):
+    # type: (Dict[bytes, ResourceType]) -> Tuple[ResourceType, ...]
+    """Expand a type-char mapping into a dense, ord-indexed tuple."""
+    return tuple(
+        type_map.get(six.int2byte(_i), ResourceType.unknown) for _i in range(256)
+    )
+
+
+def _canonicalize(name):
+    # type: (Text) -> Text
+    """Canonicalize a tar member name in a single pass.
+
+    Equivalent to ``normpath`` for the names found in archives (the
+    result is always relative), but implemented as one split plus a
+    component stack, with no regex machinery.
+
+    Raises:
+        ~fs.errors.IllegalBackReference: If the name has back-references
+            that would escape the archive root.
+
+    """
+    stack = []  # type: List[Text]
+    for part in name.split("/"):
+        if part == "..":
+            if not stack:
+                raise IllegalBackReference(name)
+            stack.pop()
+        elif part and part != ".":
+            stack.append(part)
+    return "/".join(stack)
+
+
 if six.PY2:
 
     def _get_member_info(member, encoding):
@@ -259,6 +307,11 @@ class ReadTarFS(FS):
         tarfile.LNKTYPE: ResourceType.symlink,
     }
 
+    # Dense variant of `type_map` indexed by ``ord(member.type)``, so
+    # the getinfo hot path replaces a dict probe with a tuple index.
+    # Unrecognized member types resolve to `ResourceType.unknown`.
+    _type_array = _build_type_array(type_map)
+
     @errors.CreateFailed.catch_all
     def __init__(self, file, encoding="utf-8"):  # noqa: D107
         # type: (Union[Text, BinaryIO], Text) -> None
@@ -266,35 +319,126 @@ class ReadTarFS(FS):
         self._file = file
         self.encoding = encoding
         if isinstance(file, (six.text_type, six.binary_type)):
-            self._tar = tarfile.open(file, mode="r")
+            self._fh = io.open(
+                file, "rb", buffering=_READ_BUFFER_SIZE
+            )  # type: Optional[BinaryIO]
+            try:
+                self._tar = tarfile.open(fileobj=self._fh, mode="r")
+            except Exception:
+                self._fh.close()
+                raise
         else:
+            self._fh = None
             self._tar = tarfile.open(fileobj=file, mode="r")
 
-        self._directory_cache = None
+        # Both indexes are built on first use, so constructing the
+        # filesystem never reads the archive. The build always runs to
+        # the end: duplicate names are last-entry-wins in tar (archives
+        # updated by appending), so no member is authoritative until
+        # every later entry has been seen.
+        self._directory_cache = {}  # type: Dict[Text, TarInfo]
+        # Maps each directory (implicit or explicit) to its child
+        # names, in archive order; populated with the directory cache.
+        self._directory_children = {}  # type: Dict[Text, Dict[Text, None]]
+        self._index_complete = False
+        # Path validation is pure, and walks revisit the same paths
+        # several times (isdir -> getinfo -> openbin), so memoize it.
+        # The closed check lives in `_getpath`, outside the cache.
+        self._relpath_cache = lru_cache(maxsize=4096)(
+            lambda path: relpath(self.validatepath(path))
+        )
+        # Resolved Info objects per (path, namespaces); immutable for a
+        # read-only archive, so repeated walks reuse them.
+        self._info_cache = {}  # type: Dict[Tuple[Text, frozenset], Info]
+
+    def _getpath(self, path):
+        # type: (Text) -> Text
+        self.check()
+        return self._relpath_cache(path)
+
+    def _index(self):
+        # type: () -> None
+        """Read the archive into the directory indexes."""
+        # One flat loop over a potentially huge archive: decoding is
+        # only needed on PY2 (it is the identity on PY3), and
+        # ``_canonicalize`` is bound to a local to skip the per-member
+        # global lookup.
+        _entries = self._directory_cache
+        _children = self._directory_children
+        _canon = _canonicalize
+        _decode = self._decode if six.PY2 else None
+        _next = self._tar.next
+        # `TarFile.members` is public (getmembers returns it) but
+        # missing from the typeshed stub.
+        _members = self._tar.members  # type: ignore
+        while True:
+            info = _next()
+            if info is None:
+                break
+            # tarfile appends every parsed TarInfo to its own list;
+            # drop the duplicate straight away so peak memory during
+            # the build stays at one copy.
+            del _members[:]
+            name = info.name if _decode is None else _decode(info.name)
+            # Names in well-formed archives are already canonical;
+            # detect that with a few C-level substring checks and
+            # skip the component stack entirely.
+            if (
+                name
+                and name != "."
+                and ".." not in name
+                and "//" not in name
+                and "/./" not in name
+                and not name.startswith(("/", "./"))
+                and not name.endswith(("/", "/."))
+            ):
+                _name = name
+            else:
+                try:
+                    _name = _canon(name)
+                except IllegalBackReference:
+                    # Back references outside root, must be up to no good.
+                    continue
+                if not _name:
+                    continue
+            if _name in _entries and self._info_cache:
+                # A later duplicate supersedes this name; drop any Info
+                # rendered from the stale member.
+                for key in [k for k in self._info_cache if k[0] == _name]:
+                    del self._info_cache[key]
+            _entries[_name] = info
+            parent = ""
+            for segment in _name.split("/"):
+                _children.setdefault(parent, {})[segment] = None
+                parent = segment if not parent else parent + "/" + segment
+        self._index_complete = True
+
+    def _lookup(self, _path):
+        # type: (Text) -> TarInfo
+        """Get the member for a path.
+
+        Raises:
+            KeyError: If the archive has no such member.
+
+        """
+        if not self._index_complete:
+            self._index()
+        return self._directory_cache[_path]
 
     @property
     def _directory_entries(self):
-        """Lazy directory cache."""
-        if self._directory_cache is None:
-            _decode = self._decode
-            _directory_entries = (
-                (_decode(info.name).strip("/"), info) for info in self._tar
-            )
-
-            def _list_tar():
-                for name, info in _directory_entries:
-                    try:
-                        _name = normpath(name)
-                    except IllegalBackReference:
-                        # Back references outside root, must be up to no good.
-                        pass
-                    else:
-                        if _name:
-                            yield _name, info
-
-            self._directory_cache = OrderedDict(_list_tar())
+        """The directory cache (reads the whole archive on first use)."""
+        if not self._index_complete:
+            self._index()
         return self._directory_cache
 
+    @property
+    def _children(self):
+        """Lazy child-name index, built with the directory cache."""
+        if not self._index_complete:
+            self._index()
+        return self._directory_children
+
     def __repr__(self):
         # type: () -> Text
         return "ReadTarFS({!r})".format(self._file)
@@ -325,8 +469,13 @@ class ReadTarFS(FS):
 
     def getinfo(self, path, namespaces=None):
         # type: (Text, Optional[Collection[Text]]) -> Info
-        _path = relpath(self.validatepath(path))
+        _path = self._getpath(path)
         namespaces = namespaces or ()
+        cache_key = (_path, frozenset(namespaces))
+        try:
+            return self._info_cache[cache_key]
+        except KeyError:
+            pass
         raw_info = {}  # type: Dict[Text, Dict[Text, object]]
 
         if not _path:
@@ -337,7 +486,7 @@ class ReadTarFS(FS):
         else:
             try:
                 implicit = False
-                member = self._directory_entries[_path]
+                member = self._lookup(_path)
             except KeyError:
                 if not self.isdir(_path):
                     raise errors.ResourceNotFound(path)
@@ -353,7 +502,7 @@ class ReadTarFS(FS):
             if "details" in namespaces:
                 raw_info["details"] = {
                     "size": member.size,
-                    "type": int(self.type_map[member.type]),
+                    "type": int(self._type_array[ord(member.type)]),
                 }
                 if not implicit:
                     raw_info["details"]["modified"] = member.mtime
@@ -368,26 +517,24 @@ class ReadTarFS(FS):
             if "tar" in namespaces and not implicit:
                 raw_info["tar"] = _get_member_info(member, self.encoding)
                 raw_info["tar"].update(
-                    {
-                        k.replace("is", "is_"): getattr(member, k)()
-                        for k in dir(member)
-                        if k.startswith("is")
-                    }
+                    {key: getattr(member, name)() for key, name in _TAR_IS_METHODS}
                 )
 
-        return Info(raw_info)
+        info = self._info_cache[cache_key] = Info(raw_info)
+        return info
 
     def isdir(self, path):
-        _path = relpath(self.validatepath(path))
+        _path = self._getpath(path)
         try:
-            return self._directory_entries[_path].isdir()
+            return self._lookup(_path).isdir()
         except KeyError:
-            return any(isbase(_path, name) for name in self._directory_entries)
+            # An implicit directory is any path with at least one child.
+            return _path in self._children
 
     def isfile(self, path):
-        _path = relpath(self.validatepath(path))
+        _path = self._getpath(path)
         try:
-            return self._directory_entries[_path].isfile()
+            return self._lookup(_path).isfile()
         except KeyError:
             return False
 
@@ -398,16 +545,12 @@ class ReadTarFS(FS):
 
     def listdir(self, path):
         # type: (Text) -> List[Text]
-        _path = relpath(self.validatepath(path))
+        _path = self._getpath(path)
 
         if not self.gettype(path) is ResourceType.directory:
             raise errors.DirectoryExpected(path)
 
-        children = (
-            frombase(_path, n) for n in self._directory_entries if isbase(_path, n)
-        )
-        content = (parts(child)[1] for child in children if relpath(child))
-        return list(OrderedDict.fromkeys(content))
+        return list(self._children.get(_path, ()))
 
     def makedir(
         self,  # type: T
@@ -421,13 +564,13 @@ class ReadTarFS(FS):
 
     def openbin(self, path, mode="r", buffering=-1, **options):
         # type: (Text, Text, int, **Any) -> BinaryIO
-        _path = relpath(self.validatepath(path))
+        _path = self._getpath(path)
 
         if "w" in mode or "+" in mode or "a" in mode:
             raise errors.ResourceReadOnly(path)
 
         try:
-            member = self._directory_entries[_path]
+            member = self._lookup(_path)
         except KeyError:
             six.raise_from(errors.ResourceNotFound(path), None)
 
@@ -460,6 +603,9 @@ class ReadTarFS(FS):
         super(ReadTarFS, self).close()
         if hasattr(self, "_tar"):
             self._tar.close()
+        fh = getattr(self, "_fh", None)
+        if fh is not None:
+            fh.close()
 
     def isclosed(self):
         # type: () -> bool
@@ -15,6 +15,7 @@ from __future__ import print_function, unicode_literals
 
 import typing
 
+from ._lrucompat import lru_cache
 from .errors import ResourceNotFound, ResourceReadOnly
 from .info import Info
 from .mode import check_writable
@@ -35,19 +36,25 @@ if typing.TYPE_CHECKING:
         Tuple,
     )
 
-    from datetime import datetime
-
     from .base import FS  # noqa: F401
-    from .info import RawInfo
-    from .permissions import Permissions
-    from .subfs import SubFS
 
 
-_W = typing.TypeVar("_W", bound="WrapFS")
 _T = typing.TypeVar("_T", bound="FS")
 _F = typing.TypeVar("_F", bound="FS", covariant=True)
 
 
+# Shared for the common namespaces-not-given case, saving a frozenset
+# allocation per call.
+_EMPTY_NAMESPACES = frozenset()  # type: frozenset
+
+
+@lru_cache(maxsize=4096)
+def _normalize_path(path):
+    # type: (Text) -> Text
+    """Memoized ``abspath(normpath(path))``; hot walks repeat paths."""
+    return abspath(normpath(path))
+
+
 def read_only(fs):
     # type: (_T) -> WrapReadOnly[_T]
     """Make a read-only filesystem.
@@ -92,28 +99,20 @@ class WrapCachedDir(WrapFS[_F], typing.Generic[_F]):
 
     """
 
-    # FIXME (@althonos): The caching data structure can very likely be
-    # improved. With the current implementation, if `scandir` result was
-    # cached for `namespaces=["details", "access"]`, calling `scandir`
-    # again only with `names=["details"]` will miss the cache, even though
-    # we are already storing the totality of the required metadata.
-    #
-    # A possible solution would be to replaced the cached with a
-    #     Dict[Text, Dict[Text, Dict[Text, Info]]]
-    #           ^           ^         ^     ^-- the actual info object
-    #           |           |         \-- the path of the directory entry
-    #           |           \-- the namespace of the info
-    #           \-- the cached directory entry
+    # The cache stores, per directory, the broadest set of namespaces
+    # fetched so far along with the corresponding entries. A request
+    # for a subset of the cached namespaces is answered from the cache;
+    # anything else refetches with the union and replaces the entry.
     #
-    # Furthermore, `listdir` and `filterdir` calls should be cached as well,
-    # since they can be written as wrappers of `scandir`.
+    # FIXME (@althonos): `listdir` and `filterdir` calls should be
+    # cached as well, since they can be written as wrappers of `scandir`.
 
     wrap_name = "cached-dir"
 
     def __init__(self, wrap_fs):  # noqa: D107
         # type: (_F) -> None
         super(WrapCachedDir, self).__init__(wrap_fs)
-        self._cache = {}  # type: Dict[Tuple[Text, frozenset], Dict[Text, Info]]
+        self._cache = {}  # type: Dict[Text, Tuple[frozenset, Dict[Text, Info]]]
 
     def scandir(
         self,
@@ -122,29 +121,36 @@ class WrapCachedDir(WrapFS[_F], typing.Generic[_F]):
         page=None,  # type: Optional[Tuple[int, int]]
     ):
         # type: (...) -> Iterator[Info]
-        _path = abspath(normpath(path))
-        cache_key = (_path, frozenset(namespaces or ()))
-        if cache_key not in self._cache:
-            _scan_result = self._wrap_fs.scandir(path, namespaces=namespaces, page=page)
-            _dir = {info.name: info for info in _scan_result}
-            self._cache[cache_key] = _dir
-        gen_scandir = iter(self._cache[cache_key].values())
-        return gen_scandir
+        _path = _normalize_path(path)
+        requested = _EMPTY_NAMESPACES if not namespaces else frozenset(namespaces)
+        cached = self._cache.get(_path)
+        if cached is not None and requested <= cached[0]:
+            return iter(cached[1].values())
+        if cached is not None:
+            # Widen the request so the replacement entry still
+            # satisfies everything cached before.
+            requested |= cached[0]
+            namespaces = sorted(requested)
+        _scan_result = self._wrap_fs.scandir(path, namespaces=namespaces, page=page)
+        _dir = {info.name: info for info in _scan_result}
+        self._cache[_path] = (requested, _dir)
+        return iter(_dir.values())
 
     def getinfo(self, path, namespaces=None):
         # type: (Text, Optional[Collection[Text]]) -> Info
-        _path = abspath(normpath(path))
+        _path = _normalize_path(path)
         if _path == "/":
             return Info({"basic": {"name": "", "is_dir": True}})
         dir_path, resource_name = split(_path)
-        cache_key = (dir_path, frozenset(namespaces or ()))
+        requested = _EMPTY_NAMESPACES if not namespaces else frozenset(namespaces)
 
-        if cache_key not in self._cache:
+        cached = self._cache.get(dir_path)
+        if cached is None or not requested <= cached[0]:
             self.scandir(dir_path, namespaces=namespaces)
+            cached = self._cache[dir_path]
 
-        _dir = self._cache[cache_key]
         try:
-            info = _dir[resource_name]
+            info = cached[1][resource_name]
         except KeyError:
             raise ResourceNotFound(path)
         return info
@@ -164,111 +170,79 @@ class WrapCachedDir(WrapFS[_F], typing.Generic[_F]):
             return False
 
 
-class WrapReadOnly(WrapFS[_F], typing.Generic[_F]):
-    """Makes a Filesystem read-only.
+def _forbid_mutation(method_name):
+    # type: (Text) -> Any
+    """Make a method that rejects a mutating path operation.
 
-    Any call that would would write data or modify the filesystem in any way
-    will raise a `~fs.errors.ResourceReadOnly` exception.
+    The stub bodies are all identical (`check` then raise), so they are
+    generated rather than written out once per method.
 
     """
 
-    wrap_name = "read-only"
-
-    def appendbytes(self, path, data):
-        # type: (Text, bytes) -> None
+    def forbidden(self, path, *args, **kwargs):
+        # type: (WrapReadOnly, Text, *Any, **Any) -> None
         self.check()
         raise ResourceReadOnly(path)
 
-    def appendtext(
-        self,
-        path,  # type: Text
-        text,  # type: Text
-        encoding="utf-8",  # type: Text
-        errors=None,  # type: Optional[Text]
-        newline="",  # type: Text
-    ):
-        # type: (...) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+    forbidden.__name__ = str(method_name)
+    return forbidden
 
-    def makedir(
-        self,  # type: _W
-        path,  # type: Text
-        permissions=None,  # type: Optional[Permissions]
-        recreate=False,  # type: bool
-    ):
-        # type: (...) -> SubFS[_W]
-        self.check()
-        raise ResourceReadOnly(path)
 
-    def move(self, src_path, dst_path, overwrite=False, preserve_time=False):
-        # type: (Text, Text, bool, bool) -> None
-        self.check()
-        raise ResourceReadOnly(dst_path)
+def _forbid_mutation_dst(method_name):
+    # type: (Text) -> Any
+    """Like `_forbid_mutation`, for methods taking (src_path, dst_path)."""
 
-    def openbin(self, path, mode="r", buffering=-1, **options):
-        # type: (Text, Text, int, **Any) -> BinaryIO
+    def forbidden(self, src_path, dst_path, *args, **kwargs):
+        # type: (WrapReadOnly, Text, Text, *Any, **Any) -> None
         self.check()
-        if check_writable(mode):
-            raise ResourceReadOnly(path)
-        return self._wrap_fs.openbin(path, mode=mode, buffering=-1, **options)
-
-    def remove(self, path):
-        # type: (Text) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+        raise ResourceReadOnly(dst_path)
 
-    def removedir(self, path):
-        # type: (Text) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+    forbidden.__name__ = str(method_name)
+    return forbidden
 
-    def removetree(self, path):
-        # type: (Text) -> None
-        self.check()
-        raise ResourceReadOnly(path)
 
-    def setinfo(self, path, info):
-        # type: (Text, RawInfo) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+class WrapReadOnly(WrapFS[_F], typing.Generic[_F]):
+    """Makes a Filesystem read-only.
 
-    def writetext(
-        self,
-        path,  # type: Text
-        contents,  # type: Text
-        encoding="utf-8",  # type: Text
-        errors=None,  # type: Optional[Text]
-        newline="",  # type: Text
-    ):
-        # type: (...) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+    Any call that would would write data or modify the filesystem in any way
+    will raise a `~fs.errors.ResourceReadOnly` exception.
 
-    def settimes(self, path, accessed=None, modified=None):
-        # type: (Text, Optional[datetime], Optional[datetime]) -> None
-        self.check()
-        raise ResourceReadOnly(path)
+    """
 
-    def copy(self, src_path, dst_path, overwrite=False, preserve_time=False):
-        # type: (Text, Text, bool, bool) -> None
-        self.check()
-        raise ResourceReadOnly(dst_path)
+    wrap_name = "read-only"
 
-    def create(self, path, wipe=False):
-        # type: (Text, bool) -> bool
-        self.check()
-        raise ResourceReadOnly(path)
+    def __init__(self, wrap_fs):  # noqa: D107
+        # type: (_F) -> None
+        super(WrapReadOnly, self).__init__(wrap_fs)
+        # Patched metadata per namespace; the read-only overrides never
+        # change, so the dict is built at most once per namespace.
+        self._meta_cache = {}  # type: Dict[Text, Mapping[Text, object]]
+
+    appendbytes = _forbid_mutation("appendbytes")
+    appendtext = _forbid_mutation("appendtext")
+    create = _forbid_mutation("create")
+    makedir = _forbid_mutation("makedir")
+    makedirs = _forbid_mutation("makedirs")
+    remove = _forbid_mutation("remove")
+    removedir = _forbid_mutation("removedir")
+    removetree = _forbid_mutation("removetree")
+    setinfo = _forbid_mutation("setinfo")
+    settimes = _forbid_mutation("settimes")
+    touch = _forbid_mutation("touch")
+    upload = _forbid_mutation("upload")
+    writebytes = _forbid_mutation("writebytes")
+    writefile = _forbid_mutation("writefile")
+    writetext = _forbid_mutation("writetext")
+
+    copy = _forbid_mutation_dst("copy")
+    move = _forbid_mutation_dst("move")
 
-    def makedirs(
-        self,  # type: _W
-        path,  # type: Text
-        permissions=None,  # type: Optional[Permissions]
-        recreate=False,  # type: bool
-    ):
-        # type: (...) -> SubFS[_W]
+    def openbin(self, path, mode="r", buffering=-1, **options):
+        # type: (Text, Text, int, **Any) -> BinaryIO
         self.check()
-        raise ResourceReadOnly(path)
+        if check_writable(mode):
+            raise ResourceReadOnly(path)
+        return self._wrap_fs.openbin(path, mode=mode, buffering=-1, **options)
 
     def open(
         self,
@@ -296,36 +270,15 @@ class WrapReadOnly(WrapFS[_F], typing.Generic[_F]):
             **options
         )
 
-    def writebytes(self, path, contents):
-        # type: (Text, bytes) -> None
-        self.check()
-        raise ResourceReadOnly(path)
-
-    def upload(self, path, file, chunk_size=None, **options):
-        # type: (Text, BinaryIO, Optional[int], **Any) -> None
-        self.check()
-        raise ResourceReadOnly(path)
-
-    def writefile(
-        self,
-        path,  # type: Text
-        file,  # type: IO
-        encoding=None,  # type: Optional[Text]
-        errors=None,  # type: Optional[Text]
-        newline="",  # type: Text
-    ):
-        # type: (...) -> None
-        self.check()
-        raise ResourceReadOnly(path)
-
-    def touch(self, path):
-        # type: (Text) -> None
-        self.check()
-        raise ResourceReadOnly(path)
-
     def getmeta(self, namespace="standard"):
         # type: (Text) -> Mapping[Text, object]
         self.check()
-        meta = dict(self.delegate_fs().getmeta(namespace=namespace))
-        meta.update(read_only=True, supports_rename=False)
-        return meta
+        try:
+            meta = self._meta_cache[namespace]
+        except KeyError:
+            meta = dict(self.delegate_fs().getmeta(namespace=namespace))
+            meta.update(read_only=True, supports_rename=False)
+            self._meta_cache[namespace] = meta
+        # Copy per call, as the baseline did; callers may mutate their
+        # result without poisoning the cache.
+        return dict(meta)
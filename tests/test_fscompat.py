@@ -3,10 +3,15 @@ from __future__ import unicode_literals
 import six
 import unittest
 
+import pytest
+from parameterized import parameterized
+
 from fs._fscompat import fsdecode, fsencode, fspath
 
 
 class PathMock(object):
+    __slots__ = ("_path",)
+
     def __init__(self, path):
         self._path = path
 
@@ -15,6 +20,8 @@ class PathMock(object):
 
 
 class BrokenPathMock(object):
+    __slots__ = ("_path",)
+
     def __init__(self, path):
         self._path = path
 
@@ -23,39 +30,45 @@ class BrokenPathMock(object):
 
 
 class TestFSCompact(unittest.TestCase):
-    def test_fspath(self):
-        path = PathMock("foo")
-        self.assertEqual(fspath(path), "foo")
-        path = PathMock(b"foo")
-        self.assertEqual(fspath(path), b"foo")
+    @parameterized.expand(
+        [
+            ("text_mock", PathMock("foo"), "foo"),
+            ("bytes_mock", PathMock(b"foo"), b"foo"),
+            ("text", "foo", "foo"),
+        ]
+    )
+    def test_fspath(self, _, path, expected):
+        assert fspath(path) == expected
+
+    def test_fspath_identity(self):
         path = "foo"
         assert path is fspath(path)
 
-        with self.assertRaises(TypeError):
-            fspath(100)
-
-        with self.assertRaises(TypeError):
-            fspath(PathMock(5))
-
-        with self.assertRaises(AttributeError):
-            fspath(BrokenPathMock("foo"))
-
-    def test_fsencode(self):
-        encode_bytes = fsencode(b"foo")
-        assert isinstance(encode_bytes, bytes)
-        self.assertEqual(encode_bytes, b"foo")
-
-        encode_bytes = fsencode("foo")
+    @parameterized.expand(
+        [
+            ("int", 100, TypeError),
+            ("int_mock", PathMock(5), TypeError),
+            ("broken_mock", BrokenPathMock("foo"), AttributeError),
+        ]
+    )
+    def test_fspath_error(self, _, path, exc_type):
+        with pytest.raises(exc_type):
+            fspath(path)
+
+    @parameterized.expand([("bytes", b"foo"), ("text", "foo")])
+    def test_fsencode(self, _, path):
+        encode_bytes = fsencode(path)
         assert isinstance(encode_bytes, bytes)
-        self.assertEqual(encode_bytes, b"foo")
+        assert encode_bytes == b"foo"
 
-        with self.assertRaises(TypeError):
+    def test_fsencode_error(self):
+        with pytest.raises(TypeError):
             fsencode(5)
 
-    def test_fsdecode(self):
-        decode_text = fsdecode(b"foo")
-        assert isinstance(decode_text, six.text_type)
-        decode_text = fsdecode("foo")
-        assert isinstance(decode_text, six.text_type)
-        with self.assertRaises(TypeError):
+    @parameterized.expand([("bytes", b"foo"), ("text", "foo")])
+    def test_fsdecode(self, _, path):
+        assert isinstance(fsdecode(path), six.text_type)
+
+    def test_fsdecode_error(self):
+        with pytest.raises(TypeError):
             fsdecode(5)
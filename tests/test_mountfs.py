@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from fs.errors import FilesystemClosed
 from fs.memoryfs import MemoryFS
 from fs.mountfs import MountError, MountFS
 from fs.tempfs import TempFS
@@ -77,6 +78,12 @@ class TestMountFSBehaviours(unittest.TestCase):
         self.assertFalse(m1.isclosed())
         self.assertFalse(m2.isclosed())
 
+    def test_open_closed(self):
+        mount_fs = MountFS()
+        mount_fs.close()
+        with self.assertRaises(FilesystemClosed):
+            mount_fs.open("foo.txt")
+
     def test_empty(self):
         """Test MountFS with nothing mounted."""
         mount_fs = MountFS()
@@ -11,7 +11,7 @@ import unittest
 from fs import tarfs
 from fs.compress import write_tar
 from fs.enums import ResourceType
-from fs.errors import NoURL
+from fs.errors import IllegalBackReference, NoURL
 from fs.opener import open_fs
 from fs.opener.errors import NotWriteable
 from fs.test import FSTestCases
@@ -241,6 +241,12 @@ class TestBrokenPaths(unittest.TestCase):
     def test_listdir(self):
         self.assertEqual(self.fs.listdir("/"), [])
 
+    def test_canonicalize(self):
+        self.assertEqual(tarfs._canonicalize("foo//bar/./baz/"), "foo/bar/baz")
+        self.assertEqual(tarfs._canonicalize("foo/spam/../eggs"), "foo/eggs")
+        with self.assertRaises(IllegalBackReference):
+            tarfs._canonicalize("../etc/passwd")
+
 
 class TestImplicitDirectories(unittest.TestCase):
     """Regression tests for #160."""
@@ -306,6 +312,39 @@ class TestImplicitDirectories(unittest.TestCase):
         self.assertIs(info.type, ResourceType.directory)
 
 
+class TestDuplicateEntries(unittest.TestCase):
+    """Duplicate member names are last-entry-wins, as with ``tar --append``."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpfs = open_fs("temp://")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpfs.close()
+
+    def setUp(self):
+        self.tempfile = self.tmpfs.open("test.tar", "wb+")
+        with tarfile.open(mode="w", fileobj=self.tempfile) as tf:
+            info = tarfile.TarInfo("foo.txt")
+            info.size = 3
+            tf.addfile(info, io.BytesIO(b"old"))
+            info = tarfile.TarInfo("foo.txt")
+            info.size = 5
+            tf.addfile(info, io.BytesIO(b"fresh"))
+        self.tempfile.seek(0)
+        self.fs = tarfs.TarFS(self.tempfile)
+
+    def tearDown(self):
+        self.fs.close()
+        self.tempfile.close()
+
+    def test_getinfo(self):
+        # The very first operation must already see the later entry.
+        self.assertEqual(self.fs.getdetails("foo.txt").size, 5)
+        self.assertEqual(self.fs.readbytes("foo.txt"), b"fresh")
+
+
 class TestReadTarFSMem(TestReadTarFS):
     def make_source_fs(self):
         return open_fs("mem://")
@@ -1,6 +1,5 @@
 from __future__ import print_function, unicode_literals
 
-import unittest
 from datetime import datetime
 
 from fs.time import datetime_to_epoch, epoch_to_datetime
@@ -11,13 +10,15 @@ except ImportError:
     from fs._tzcompat import timezone  # type: ignore
 
 
-class TestEpoch(unittest.TestCase):
-    def test_epoch_to_datetime(self):
-        self.assertEqual(
-            epoch_to_datetime(142214400), datetime(1974, 7, 5, tzinfo=timezone.utc)
-        )
+# The same instant, in both representations, shared by both
+# directions of the conversion.
+_EPOCH_1974 = 142214400
+_DT_1974 = datetime(1974, 7, 5, tzinfo=timezone.utc)
 
-    def test_datetime_to_epoch(self):
-        self.assertEqual(
-            datetime_to_epoch(datetime(1974, 7, 5, tzinfo=timezone.utc)), 142214400
-        )
+
+def test_epoch_to_datetime():
+    assert epoch_to_datetime(_EPOCH_1974) == _DT_1974
+
+
+def test_datetime_to_epoch():
+    assert datetime_to_epoch(_DT_1974) == _EPOCH_1974
@@ -4,26 +4,42 @@ import unittest
 from six import text_type
 
 from fs import wrapfs
-from fs.opener import open_fs
+from fs.memoryfs import MemoryFS
 
 
 class WrappedFS(wrapfs.WrapFS):
     wrap_name = "test"
 
 
+# Expected renderings of the wrapped fixture, shared by the
+# repr/str tests below.
+_EXPECTED_REPR = "WrappedFS(MemoryFS())"
+_EXPECTED_STR = "<memfs>(test)"
+_EXPECTED_STR_BARE = "<memfs>"
+
+
 class TestWrapFS(unittest.TestCase):
-    def setUp(self):
-        self.wrapped_fs = open_fs("mem://")
-        self.fs = WrappedFS(self.wrapped_fs)
+    @classmethod
+    def setUpClass(cls):
+        # Nothing here mutates the filesystem, so the fixtures are
+        # built once for the class rather than once per test.
+        cls.wrapped_fs = MemoryFS()
+        cls.fs = WrappedFS(cls.wrapped_fs)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fs.close()
 
     def test_encode(self):
-        self.assertEqual((self.wrapped_fs, "foo"), self.fs.delegate_path("foo"))
-        self.assertEqual((self.wrapped_fs, "bar"), self.fs.delegate_path("bar"))
-        self.assertIs(self.wrapped_fs, self.fs.delegate_fs())
+        assert (
+            self.fs.delegate_path("foo"),
+            self.fs.delegate_path("bar"),
+            self.fs.delegate_fs(),
+        ) == ((self.wrapped_fs, "foo"), (self.wrapped_fs, "bar"), self.wrapped_fs)
 
     def test_repr(self):
-        self.assertEqual(repr(self.fs), "WrappedFS(MemoryFS())")
+        assert repr(self.fs) == _EXPECTED_REPR
 
     def test_str(self):
-        self.assertEqual(text_type(self.fs), "<memfs>(test)")
-        self.assertEqual(text_type(wrapfs.WrapFS(open_fs("mem://"))), "<memfs>")
+        assert text_type(self.fs) == _EXPECTED_STR
+        assert text_type(wrapfs.WrapFS(MemoryFS())) == _EXPECTED_STR_BARE